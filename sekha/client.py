@@ -3,17 +3,62 @@ Main client for interacting with Sekha API
 """
 
 import asyncio
+import copy
+import sys
+import threading
 import httpx
-from typing import Optional, List, Dict, Any
+import pydantic_core
+from pydantic import TypeAdapter
+from typing import (
+    Optional,
+    List,
+    Dict,
+    Any,
+    AsyncIterator,
+    Coroutine,
+    Set,
+    Tuple,
+    TypeVar,
+)
 from dataclasses import dataclass
-import backoff
 
 from .models import *
 from .errors import *
 from .utils import RateLimiter, ExponentialBackoff, validate_api_key, validate_base_url
 
+_T = TypeVar("_T")
 
-@dataclass
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# dataclass(slots=True) is only available on Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# List adapters validate a whole response array in one pass
+_CONV_LIST = TypeAdapter(List[ConversationResponse])
+_PRUNE_LIST = TypeAdapter(List[PruningSuggestion])
+_LABEL_LIST = TypeAdapter(List[LabelSuggestion])
+
+
+def _api_error(
+    e: httpx.HTTPStatusError,
+    message: str,
+    *,
+    invalid: Optional[str] = None,
+    not_found: Optional[str] = None,
+) -> SekhaError:
+    """Map an HTTP error response to the matching SDK exception"""
+    response = e.response
+    code = response.status_code
+    if code == 400:
+        return SekhaValidationError(invalid or message, response.text)
+    if code == 401:
+        return SekhaAuthError("Invalid API key")
+    if code == 404:
+        return SekhaNotFoundError(not_found or message)
+    return SekhaAPIError(message, code, response.text)
+
+
+@dataclass(frozen=True, **_SLOTS)
 class ClientConfig:
     """Client configuration"""
 
@@ -21,9 +66,10 @@ class ClientConfig:
     base_url: str = "http://localhost:8080"
     timeout: float = 30.0
     max_retries: int = 3
-    rate_limit_requests: int = 1000  # per minute
+    rate_limit_requests: Optional[int] = 1000  # per minute, None for unlimited
     rate_limit_window: float = 60.0
     default_label: Optional[str] = None
+    max_concurrent: int = 64  # max in-flight requests per client
 
     def __post_init__(self):
         """Validate configuration after initialization"""
@@ -36,6 +82,12 @@ class ClientConfig:
         if self.max_retries < 0:
             raise ValueError("max_retries must be non-negative")
 
+        if self.rate_limit_window <= 0:
+            raise ValueError("rate_limit_window must be positive")
+
+        if self.max_concurrent < 1:
+            raise ValueError("max_concurrent must be positive")
+
 
 class SekhaClient:
     """
@@ -55,24 +107,47 @@ class SekhaClient:
         validate_api_key(config.api_key)
 
         self.config = config
-        self.rate_limiter = RateLimiter(
-            config.rate_limit_requests, config.rate_limit_window
-        )
-        self.backoff = ExponentialBackoff(base_delay=0.5, max_delay=10.0, factor=2.0)
+        self._reset_state()
 
-        # Create httpx client with connection pooling
+        # Static headers, built once and shared by the async and sync clients
+        self._headers = {
+            "Authorization": f"Bearer {config.api_key}",
+            "User-Agent": "Sekha-Python-SDK/0.5.0",
+        }
+
+        # Create httpx client with connection pooling, multiplexing
+        # concurrent requests over HTTP/2 where the server supports it
         self.client = httpx.AsyncClient(
             base_url=config.base_url,
             timeout=config.timeout,
-            headers={
-                "Authorization": f"Bearer {config.api_key}",
-                "User-Agent": "Sekha-Python-SDK/0.5.0",
-            },
+            headers=self._headers,
+            http2=True,
+            limits=self._limits(),
         )
 
         # For sync operations, we'll create clients on-demand
         self._sync_client: Optional[httpx.Client] = None
 
+    def _reset_state(self) -> None:
+        """(Re)build the per-client request state, leaving the HTTP clients alone"""
+        self.rate_limiter = RateLimiter(
+            self.config.rate_limit_requests, self.config.rate_limit_window
+        )
+        # Template for retry delays; each call retries on its own copy
+        self.backoff = ExponentialBackoff(base_delay=0.5, max_delay=10.0, factor=2.0)
+        # Bounds fan-out to what the connection pool (sized to match) can
+        # service; created on first use so it binds to the loop that uses it
+        self._sem: Optional[asyncio.Semaphore] = None
+        # Optional endpoints this server answered 404 for; not probed again
+        self._missing_endpoints: Set[str] = set()
+
+    @property
+    def _semaphore(self) -> asyncio.Semaphore:
+        """In-flight request limiter, created lazily on first use"""
+        if self._sem is None:
+            self._sem = asyncio.Semaphore(self.config.max_concurrent)
+        return self._sem
+
     async def __aenter__(self):
         """Async context manager entry"""
         return self
@@ -93,18 +168,28 @@ class SekhaClient:
             self._sync_client = httpx.Client(
                 base_url=self.config.base_url,
                 timeout=self.config.timeout,
-                headers={
-                    "Authorization": f"Bearer {self.config.api_key}",
-                    "User-Agent": "Sekha-Python-SDK/0.5.0",
-                },
+                headers=self._headers,
+                http2=True,
+                limits=self._limits(),
             )
         return self._sync_client
 
+    def _new_backoff(self) -> ExponentialBackoff:
+        """Fresh backoff for one call, so concurrent retries don't share attempts"""
+        backoff = copy.copy(self.backoff)
+        backoff.reset()
+        return backoff
+
+    def _limits(self) -> httpx.Limits:
+        """Connection pool limits sized to the in-flight request cap"""
+        return httpx.Limits(
+            max_connections=self.config.max_concurrent,
+            max_keepalive_connections=self.config.max_concurrent,
+            keepalive_expiry=30.0,
+        )
+
     # ============== Conversation Operations ==============
 
-    @backoff.on_exception(
-        backoff.expo, (SekhaConnectionError, httpx.TimeoutException), max_tries=3
-    )
     async def create_conversation(
         self,
         conversation: NewConversation,
@@ -122,47 +207,115 @@ class SekhaClient:
             SekhaValidationError: Invalid input
             SekhaAPIError: API returned error
         """
-        await self.rate_limiter.acquire()
+        payload = conversation.model_dump_json().encode("utf-8")
+        backoff = self._new_backoff()
+
+        for attempt in range(self.config.max_retries + 1):
+            if attempt:
+                await backoff.wait()
+            await self.rate_limiter.acquire()
+
+            try:
+                async with self._semaphore:
+                    response = await self.client.post(
+                        "/api/v1/conversations",
+                        content=payload,
+                        headers=_JSON_HEADERS,
+                    )
+                response.raise_for_status()
+                return ConversationResponse.model_validate(response.json())
+
+            except httpx.HTTPStatusError as e:
+                raise _api_error(
+                    e,
+                    "Failed to create conversation",
+                    invalid="Invalid conversation data",
+                ) from e
+            except httpx.TimeoutException:
+                continue
+            except Exception as e:
+                raise SekhaError(f"Unexpected error: {e}")
+
+        raise SekhaConnectionError("Request timed out")
+
+    async def create_conversations_bulk(
+        self,
+        conversations: List[NewConversation],
+    ) -> List[ConversationResponse]:
+        """
+        Create many conversations in a single request
 
-        try:
-            response = await self.client.post(
-                "/api/v1/conversations",
-                json=conversation.model_dump(),
-            )
-            response.raise_for_status()
-            return ConversationResponse(**response.json())
+        Falls back to concurrent create_conversation calls (at most 16 in
+        flight) if the server has no batch endpoint.
 
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 400:
-                raise SekhaValidationError("Invalid conversation data", e.response.text)
-            elif e.response.status_code == 401:
-                raise SekhaAuthError("Invalid API key")
-            else:
-                raise SekhaAPIError(
-                    f"Failed to create conversation: {e.response.text}",
-                    e.response.status_code,
-                    e.response.text,
-                )
-        except httpx.TimeoutException:
-            raise SekhaConnectionError("Request timed out")
-        except Exception as e:
-            raise SekhaError(f"Unexpected error: {e}")
+        Args:
+            conversations: NewConversation objects
+
+        Returns:
+            Created conversations, in input order
+
+        Raises:
+            SekhaValidationError: Invalid input
+            SekhaAPIError: API returned error
+        """
+        if not conversations:
+            return []
+
+        if "batch" not in self._missing_endpoints:
+            await self.rate_limiter.acquire()
+
+            try:
+                async with self._semaphore:
+                    response = await self.client.post(
+                        "/api/v1/conversations:batch",
+                        content=pydantic_core.to_json(conversations),
+                        headers=_JSON_HEADERS,
+                    )
+                if response.status_code != 404:
+                    response.raise_for_status()
+                    return _CONV_LIST.validate_python(response.json())
+                self._missing_endpoints.add("batch")
+
+            except httpx.HTTPStatusError as e:
+                raise _api_error(
+                    e,
+                    "Failed to create conversations",
+                    invalid="Invalid conversation data",
+                ) from e
+            except httpx.TimeoutException:
+                raise SekhaConnectionError("Request timed out")
+            except httpx.ConnectError as e:
+                raise SekhaConnectionError(f"Connection failed: {e}")
+            except Exception as e:
+                raise SekhaError(f"Failed to create conversations: {e}")
+
+        # Batch endpoint not available: fan out individual requests
+        semaphore = asyncio.Semaphore(16)
+
+        async def create_one(conversation: NewConversation) -> ConversationResponse:
+            async with semaphore:
+                return await self.create_conversation(conversation)
+
+        return list(await asyncio.gather(*map(create_one, conversations)))
 
     async def get_conversation(self, conversation_id: str) -> ConversationResponse:
         """Get conversation by ID"""
         await self.rate_limiter.acquire()
 
         try:
-            response = await self.client.get(f"/api/v1/conversations/{conversation_id}")
+            async with self._semaphore:
+                response = await self.client.get(
+                    f"/api/v1/conversations/{conversation_id}"
+                )
             response.raise_for_status()
-            return ConversationResponse(**response.json())
+            return ConversationResponse.model_validate(response.json())
 
         except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                raise SekhaNotFoundError(f"Conversation {conversation_id} not found")
-            raise SekhaAPIError(
-                "Failed to get conversation", e.response.status_code, e.response.text
-            )
+            raise _api_error(
+                e,
+                "Failed to get conversation",
+                not_found=f"Conversation {conversation_id} not found",
+            ) from e
 
     async def list_conversations(
         self,
@@ -171,6 +324,60 @@ class SekhaClient:
         page_size: int = 50,
     ) -> List[ConversationResponse]:
         """List conversations with optional filtering"""
+        results, _ = await self._list_page(label, page, page_size)
+        return results
+
+    async def iter_conversations(
+        self,
+        label: Optional[str] = None,
+        page_size: int = 50,
+        concurrency: int = 8,
+    ) -> AsyncIterator[ConversationResponse]:
+        """
+        Iterate over all conversations, fetching pages concurrently
+
+        The first page tells us the total count; the remaining pages are
+        then fetched in windows of `concurrency` concurrent requests, each
+        window yielded before the next is requested.
+
+        Args:
+            label: Optional label filter
+            page_size: Conversations per page
+            concurrency: Max concurrent page requests
+
+        Yields:
+            Conversations in page order
+        """
+        results, total = await self._list_page(label, 1, page_size)
+        for conv in results:
+            yield conv
+
+        if total is None:
+            # No total reported: walk pages until a short one
+            page = 1
+            while len(results) == page_size:
+                page += 1
+                results, _ = await self._list_page(label, page, page_size)
+                for conv in results:
+                    yield conv
+            return
+
+        # Fetch a window of pages at a time so memory stays bounded and
+        # results reach the caller before the last page arrives
+        n_pages = -(-total // page_size)
+        for start in range(2, n_pages + 1, concurrency):
+            window = range(start, min(start + concurrency, n_pages + 1))
+            pages = await asyncio.gather(
+                *(self._list_page(label, page, page_size) for page in window)
+            )
+            for results, _ in pages:
+                for conv in results:
+                    yield conv
+
+    async def _list_page(
+        self, label: Optional[str], page: int, page_size: int
+    ) -> Tuple[List[ConversationResponse], Optional[int]]:
+        """Fetch one page of the listing and the total count, if reported"""
         await self.rate_limiter.acquire()
 
         params: Dict[str, Any] = {"page": page, "page_size": page_size}
@@ -178,14 +385,18 @@ class SekhaClient:
             params["label"] = label
 
         try:
-            response = await self.client.get(
-                "/api/v1/conversations",
-                params=params,
-            )
+            async with self._semaphore:
+                response = await self.client.get(
+                    "/api/v1/conversations",
+                    params=params,
+                )
             response.raise_for_status()
             data = response.json()
-            return [ConversationResponse(**conv) for conv in data.get("results", [])]
+            results = _CONV_LIST.validate_python(data.get("results", []))
+            return results, data.get("total")
 
+        except httpx.HTTPStatusError as e:
+            raise _api_error(e, "Failed to list conversations") from e
         except Exception as e:
             raise SekhaError(f"Failed to list conversations: {e}")
 
@@ -203,35 +414,37 @@ class SekhaClient:
             body["folder"] = new_folder
 
         try:
-            response = await self.client.put(
-                f"/api/v1/conversations/{conversation_id}/label",
-                json=body,
-            )
+            async with self._semaphore:
+                response = await self.client.put(
+                    f"/api/v1/conversations/{conversation_id}/label",
+                    json=body,
+                )
             response.raise_for_status()
 
         except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                raise SekhaNotFoundError(f"Conversation {conversation_id} not found")
-            raise SekhaAPIError(
-                "Failed to update label", e.response.status_code, e.response.text
-            )
+            raise _api_error(
+                e,
+                "Failed to update label",
+                not_found=f"Conversation {conversation_id} not found",
+            ) from e
 
     async def delete_conversation(self, conversation_id: str) -> None:
         """Delete a conversation"""
         await self.rate_limiter.acquire()
 
         try:
-            response = await self.client.delete(
-                f"/api/v1/conversations/{conversation_id}"
-            )
+            async with self._semaphore:
+                response = await self.client.delete(
+                    f"/api/v1/conversations/{conversation_id}"
+                )
             response.raise_for_status()
 
         except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                raise SekhaNotFoundError(f"Conversation {conversation_id} not found")
-            raise SekhaAPIError(
-                "Failed to delete conversation", e.response.status_code, e.response.text
-            )
+            raise _api_error(
+                e,
+                "Failed to delete conversation",
+                not_found=f"Conversation {conversation_id} not found",
+            ) from e
 
     # ============== Smart Query ==============
 
@@ -254,29 +467,92 @@ class SekhaClient:
         Returns:
             Query response with assembled context
         """
-        await self.rate_limiter.acquire()
+        body = QueryRequest(query=query, limit=limit, filters=filters)
+        payload = body.model_dump_json().encode("utf-8")
+        backoff = self._new_backoff()
+
+        for attempt in range(self.config.max_retries + 1):
+            if attempt:
+                await backoff.wait()
+            await self.rate_limiter.acquire()
+
+            try:
+                async with self._semaphore:
+                    response = await self.client.post(
+                        "/api/v1/query/smart",
+                        content=payload,
+                        headers=_JSON_HEADERS,
+                    )
+                response.raise_for_status()
+                return QueryResponse.model_validate(response.json())
+
+            except httpx.HTTPStatusError as e:
+                raise _api_error(
+                    e, "Smart query failed", invalid="Invalid query parameters"
+                ) from e
+            except httpx.TimeoutException:
+                error = SekhaConnectionError("Smart query timed out")
+            except httpx.ConnectError as e:
+                error = SekhaConnectionError(f"Connection failed: {e}")
+            except Exception as e:
+                raise SekhaError(f"Smart query failed: {e}")
+
+        raise error
+
+    async def smart_query_stream(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[QueryResult]:
+        """
+        Stream smart query results as the server produces them
+
+        Requests NDJSON so results can be parsed while the rest of the
+        response is still arriving.
+
+        Args:
+            query: Search query
+            limit: Max results
+            filters: Metadata filters
 
+        Yields:
+            Query results in server order
+        """
         body = QueryRequest(query=query, limit=limit, filters=filters)
+        await self.rate_limiter.acquire()
 
         try:
-            response = await self.client.post(
-                "/api/v1/query/smart",
-                json=body.model_dump(),
-            )
-            response.raise_for_status()
-            return QueryResponse(**response.json())
+            async with self._semaphore:
+                async with self.client.stream(
+                    "POST",
+                    "/api/v1/query/smart",
+                    content=body.model_dump_json().encode("utf-8"),
+                    headers={**_JSON_HEADERS, "Accept": "application/x-ndjson"},
+                ) as response:
+                    if response.is_error:
+                        await response.aread()
+                    response.raise_for_status()
+
+                    if response.headers.get("content-type", "").startswith(
+                        "application/json"
+                    ):
+                        # Server doesn't stream: fall back to the full response
+                        await response.aread()
+                        for result in QueryResponse.model_validate(
+                            response.json()
+                        ).results:
+                            yield result
+                        return
+
+                    async for line in response.aiter_lines():
+                        if line:
+                            yield QueryResult.model_validate_json(line)
 
         except httpx.HTTPStatusError as e:
-            if e.response.status_code == 400:
-                raise SekhaValidationError("Invalid query parameters", e.response.text)
-            elif e.response.status_code == 401:
-                raise SekhaAuthError("Invalid API key")
-            else:
-                raise SekhaAPIError(
-                    f"Smart query failed: {e.response.text}",
-                    e.response.status_code,
-                    e.response.text,
-                )
+            raise _api_error(
+                e, "Smart query failed", invalid="Invalid query parameters"
+            ) from e
         except httpx.TimeoutException:
             raise SekhaConnectionError("Smart query timed out")
         except httpx.ConnectError as e:
@@ -294,12 +570,15 @@ class SekhaClient:
         await self.rate_limiter.acquire()
 
         try:
-            response = await self.client.post(
-                f"/api/v1/messages/{message_id}/importance",
-            )
+            async with self._semaphore:
+                response = await self.client.post(
+                    f"/api/v1/messages/{message_id}/importance",
+                )
             response.raise_for_status()
-            return ImportanceScore(**response.json())
+            return ImportanceScore.model_validate(response.json())
 
+        except httpx.HTTPStatusError as e:
+            raise _api_error(e, "Failed to score message") from e
         except Exception as e:
             raise SekhaError(f"Failed to score message: {e}")
 
@@ -314,13 +593,16 @@ class SekhaClient:
         await self.rate_limiter.acquire()
 
         try:
-            response = await self.client.post(
-                f"/api/v1/conversations/{conversation_id}/summary",
-                params={"level": level.value},
-            )
+            async with self._semaphore:
+                response = await self.client.post(
+                    f"/api/v1/conversations/{conversation_id}/summary",
+                    params={"level": level.value},
+                )
             response.raise_for_status()
-            return SummaryResponse(**response.json())
+            return SummaryResponse.model_validate(response.json())
 
+        except httpx.HTTPStatusError as e:
+            raise _api_error(e, "Failed to generate summary") from e
         except Exception as e:
             raise SekhaError(f"Failed to generate summary: {e}")
 
@@ -335,17 +617,20 @@ class SekhaClient:
         await self.rate_limiter.acquire()
 
         try:
-            response = await self.client.get(
-                "/api/v1/prune/suggestions",
-                params={
-                    "threshold_days": threshold_days,
-                    "importance_threshold": importance_threshold,
-                },
-            )
+            async with self._semaphore:
+                response = await self.client.get(
+                    "/api/v1/prune/suggestions",
+                    params={
+                        "threshold_days": threshold_days,
+                        "importance_threshold": importance_threshold,
+                    },
+                )
             response.raise_for_status()
             data = response.json()
-            return [PruningSuggestion(**s) for s in data]
+            return _PRUNE_LIST.validate_python(data)
 
+        except httpx.HTTPStatusError as e:
+            raise _api_error(e, "Failed to get pruning suggestions") from e
         except Exception as e:
             raise SekhaError(f"Failed to get pruning suggestions: {e}")
 
@@ -359,13 +644,16 @@ class SekhaClient:
         await self.rate_limiter.acquire()
 
         try:
-            response = await self.client.post(
-                f"/api/v1/conversations/{conversation_id}/suggest-labels",
-            )
+            async with self._semaphore:
+                response = await self.client.post(
+                    f"/api/v1/conversations/{conversation_id}/suggest-labels",
+                )
             response.raise_for_status()
             data = response.json()
-            return [LabelSuggestion(**s) for s in data]
+            return _LABEL_LIST.validate_python(data)
 
+        except httpx.HTTPStatusError as e:
+            raise _api_error(e, "Failed to suggest labels") from e
         except Exception as e:
             raise SekhaError(f"Failed to suggest labels: {e}")
 
@@ -377,10 +665,35 @@ class SekhaClient:
         """
         Auto-apply label if confidence exceeds threshold
 
+        Uses the server-side auto-label endpoint in a single round-trip,
+        falling back to suggest_labels + update_label on servers without it.
+
         Returns:
             Applied label or None if no label met threshold
         """
+        if "auto-label" not in self._missing_endpoints:
+            await self.rate_limiter.acquire()
+
+            try:
+                async with self._semaphore:
+                    response = await self.client.post(
+                        f"/api/v1/conversations/{conversation_id}/auto-label",
+                        params={"threshold": threshold},
+                    )
+                if response.status_code != 404:
+                    response.raise_for_status()
+                    label: Optional[str] = response.json().get("label")
+                    return label
+
+            except httpx.HTTPStatusError as e:
+                raise _api_error(e, "Auto-label failed") from e
+            except Exception as e:
+                raise SekhaError(f"Auto-label failed: {e}")
+
+        # Endpoint not available: suggest, then apply
         suggestions = await self.suggest_labels(conversation_id)
+        # suggest_labels found the conversation, so the 404 meant the endpoint
+        self._missing_endpoints.add("auto-label")
 
         for suggestion in suggestions:
             if suggestion.confidence >= threshold:
@@ -424,43 +737,71 @@ class SekhaClient:
             params["label"] = label
 
         try:
-            response = await self.client.get(
-                "/api/v1/export",
-                params=params,
-            )
+            if format == "markdown":
+                return await self._export_markdown(params)
+
+            async with self._semaphore:
+                response = await self.client.get(
+                    "/api/v1/export",
+                    params=params,
+                )
             response.raise_for_status()
 
             data = response.json()
             return data["content"]
 
         except httpx.HTTPStatusError as e:
-            if e.response.status_code == 400:
-                raise SekhaValidationError("Invalid export parameters", e.response.text)
-            raise SekhaAPIError(
-                "Export failed", e.response.status_code, e.response.text
-            )
+            raise _api_error(
+                e, "Export failed", invalid="Invalid export parameters"
+            ) from e
         except Exception as e:
             raise SekhaError(f"Export failed: {e}")
 
+    async def _export_markdown(self, params: Dict[str, str]) -> str:
+        """Stream a markdown export into a buffer without a JSON envelope"""
+        async with self._semaphore:
+            async with self.client.stream(
+                "GET",
+                "/api/v1/export",
+                params=params,
+                headers={"Accept": "text/markdown"},
+            ) as response:
+                if response.is_error:
+                    await response.aread()
+                response.raise_for_status()
+
+                if response.headers.get("content-type", "").startswith(
+                    "application/json"
+                ):
+                    # Server ignored the Accept header and sent the JSON envelope
+                    await response.aread()
+                    content: str = response.json()["content"]
+                    return content
+
+                buf = bytearray()
+                async for chunk in response.aiter_bytes():
+                    buf += chunk
+                return buf.decode(response.encoding or "utf-8")
+
     async def _update_status(self, conversation_id: str, status: str) -> None:
         """Internal method to update conversation status"""
         await self.rate_limiter.acquire()
 
         try:
-            response = await self.client.put(
-                f"/api/v1/conversations/{conversation_id}/status",
-                json={"status": status},
-            )
+            async with self._semaphore:
+                response = await self.client.put(
+                    f"/api/v1/conversations/{conversation_id}/status",
+                    json={"status": status},
+                )
             response.raise_for_status()
 
         except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                raise SekhaNotFoundError(f"Conversation {conversation_id} not found")
-            elif e.response.status_code == 400:
-                raise SekhaValidationError("Invalid status", e.response.text)
-            raise SekhaAPIError(
-                "Status update failed", e.response.status_code, e.response.text
-            )
+            raise _api_error(
+                e,
+                "Status update failed",
+                invalid="Invalid status",
+                not_found=f"Conversation {conversation_id} not found",
+            ) from e
         except Exception as e:
             raise SekhaError(f"Status update failed: {e}")
 
@@ -471,10 +812,13 @@ class SekhaClient:
         await self.rate_limiter.acquire()
 
         try:
-            response = await self.client.get("/mcp/tools")
+            async with self._semaphore:
+                response = await self.client.get("/mcp/tools")
             response.raise_for_status()
             return response.json()
 
+        except httpx.HTTPStatusError as e:
+            raise _api_error(e, "Failed to get MCP tools") from e
         except Exception as e:
             raise SekhaError(f"Failed to get MCP tools: {e}")
 
@@ -487,31 +831,53 @@ class SyncSekhaClient:
     Synchronous wrapper for SekhaClient
 
     All async methods are available as sync methods.
-    Uses httpx.Client internally with same config.
+    Calls are dispatched to a dedicated background event loop so the
+    underlying httpx connection pool is reused across calls. Use it as a
+    context manager or call close() to stop the loop and its thread.
     """
 
     def __init__(self, config: ClientConfig):
         self._async_client = SekhaClient(config)
+        self._wrappers: Dict[str, Any] = {}
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
 
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self._async_client.sync_client.close()
+        self.close()
+
+    def close(self) -> None:
+        """Close the HTTP clients and stop the background event loop"""
+        if self._loop.is_closed():
+            return
+        if self._async_client._sync_client is not None:
+            self._async_client._sync_client.close()
+        self._run(self._async_client.close())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def _run(self, coro: Coroutine[Any, Any, _T]) -> _T:
+        """Run a coroutine on the background loop and wait for its result"""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
 
     def __getattr__(self, name: str):
         """Delegate to async client"""
+        if name in self._wrappers:
+            return self._wrappers[name]
+
         async_method = getattr(self._async_client, name)
 
         if not asyncio.iscoroutinefunction(async_method):
             return async_method
 
         def sync_wrapper(*args, **kwargs):
-            # Simpler than maintaining full sync/async duplication
-            import asyncio
-
-            return asyncio.run(async_method(*args, **kwargs))
+            return self._run(async_method(*args, **kwargs))
 
+        self._wrappers[name] = sync_wrapper
         return sync_wrapper
 
 
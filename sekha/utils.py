@@ -3,72 +3,174 @@ Utility functions for the SDK
 """
 
 import asyncio
-import time
-from typing import Any, TypeVar
-import json
-from datetime import datetime
+import math
+import random
+from time import monotonic
+from typing import Awaitable, Callable, Optional, TypeVar
+from datetime import datetime, timezone
 import re
 
+try:
+    from ciso8601 import parse_datetime as _parse_datetime
+except ImportError:  # pragma: no cover - optional speedup
+    _parse_datetime = None  # type: ignore[assignment]
+
 T = TypeVar("T")
 
+_UTC = timezone.utc
+# Tried in order only when fromisoformat fails; strptime's %z also accepts Z
+_FALLBACK_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S.%f%z",
+    "%Y-%m-%dT%H:%M:%S%z",
+    "%Y-%m-%dT%H:%M:%S.%f",
+)
+
+_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+# One bound formatter per unit, so the unit isn't re-substituted on every call
+_TMPLS = tuple(("{:.1f} " + unit).format for unit in _UNITS)
+
+_TEST_KEY_PREFIX = "sk-test-"
+_VALID_PREFIX = ("sk-sekha-",)
 
-def json_serializer(obj: Any) -> str:
-    """Custom JSON serializer for common types"""
-    if hasattr(obj, "dict"):
-        return json.dumps(obj.dict(), default=str)
-    return json.dumps(obj, default=str)
+_URL_RE = re.compile(r"^https?://[^\s/$.?#].[^\s]*$", re.IGNORECASE)
 
 
 class RateLimiter:
     """Simple token bucket rate limiter"""
 
-    def __init__(self, max_requests: int, window_seconds: float = 60.0):
+    __slots__ = (
+        "max_requests",
+        "window_seconds",
+        "_disabled",
+        "_capacity",
+        "_rate",
+        "_tokens",
+        "_now",
+        "_sleep",
+        "_last_refill",
+    )
+
+    def __init__(
+        self,
+        max_requests: Optional[int],
+        window_seconds: float = 60.0,
+        time_func: Callable[[], float] = monotonic,
+        sleep_func: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ):
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-        self.requests: list[float] = []
-        self._lock = asyncio.Lock()
-
-    async def acquire(self):
-        """Acquire a token, waiting if necessary"""
-        async with self._lock:
-            now = time.time()
-
-            # Remove old requests outside window
-            self.requests = [
-                req for req in self.requests if now - req < self.window_seconds
-            ]
-
-            # If at limit, wait
-            if self.max_requests <= 0:
-                # Always wait full window if max_requests is 0
-                await asyncio.sleep(self.window_seconds)
-            elif len(self.requests) >= self.max_requests:
-                wait_time = self.window_seconds - (now - self.requests[0])
-                if wait_time > 0:
-                    await asyncio.sleep(wait_time)
-
-            # Record this request
-            self.requests.append(now)
+        # max_requests=None disables rate limiting entirely
+        self._disabled = max_requests is None
+        self._capacity = float(max_requests or 0)
+        self._rate = self._capacity / window_seconds
+        self._tokens = self._capacity
+        # monotonic is the clock the default event loop reports through
+        # loop.time(), but readable before any loop is running
+        self._now = time_func
+        self._sleep = sleep_func
+        self._last_refill = self._now()
+
+    def _refill(self, now: float) -> None:
+        """Top up tokens for the time elapsed up to `now`"""
+        self._tokens = min(
+            self._capacity, self._tokens + (now - self._last_refill) * self._rate
+        )
+        self._last_refill = now
+
+    def _try_acquire(self, now: float, amount: float) -> float:
+        """Refill up to `now` and take `amount` tokens; return seconds to wait"""
+        self._refill(now)
+        if self._tokens >= amount:
+            self._tokens -= amount
+            return 0.0
+        return (amount - self._tokens) / self._rate
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        """Acquire `amount` tokens at once, waiting if necessary
+
+        Waits until the bucket holds `amount` tokens, so it never goes into
+        debt; an `amount` above the capacity could never be satisfied and
+        raises ValueError, as does a non-positive one. Use acquire_many()
+        for batches beyond the burst.
+        """
+        if amount <= 0:
+            raise ValueError("amount must be positive")
+
+        if self._disabled:
+            return
+
+        if self._capacity <= 0:
+            # Always wait full window if max_requests is 0
+            await self._sleep(self.window_seconds)
+            return
+
+        if amount > self._capacity:
+            raise ValueError("Can't acquire more than the maximum capacity")
+
+        # The token math never awaits, so on a single event loop it is atomic
+        # without a lock; only callers that come up short suspend at all
+        while True:
+            wait_time = self._try_acquire(self._now(), amount)
+            if not wait_time:
+                return
+            await self._sleep(wait_time)
+
+    async def acquire_many(self, n: int) -> None:
+        """Reserve `n` tokens at once and sleep a single time for any deficit
+
+        Unlike acquire(), `n` may exceed the capacity: the tokens are taken
+        up front, the bucket goes into debt, and later callers (including
+        acquire()) wait until it has been paid back.
+        """
+        if self._disabled or n <= 0:
+            return
+
+        if self._capacity <= 0:
+            await self._sleep(self.window_seconds)
+            return
+
+        self._refill(self._now())
+        self._tokens -= n
+        if self._tokens < 0:
+            await self._sleep(-self._tokens / self._rate)
 
 
 class ExponentialBackoff:
     """Exponential backoff with jitter"""
 
+    __slots__ = ("base_delay", "max_delay", "factor", "jitter", "attempt", "_sleep")
+
     def __init__(
-        self, base_delay: float = 0.1, max_delay: float = 60.0, factor: float = 2.0
+        self,
+        base_delay: float = 0.1,
+        max_delay: float = 60.0,
+        factor: float = 2.0,
+        jitter: bool = True,
+        sleep_func: Callable[[float], Awaitable[None]] = asyncio.sleep,
     ):
         self.base_delay = base_delay
         self.max_delay = max_delay
         self.factor = factor
+        self.jitter = jitter
         self.attempt = 0
+        self._sleep = sleep_func
 
     async def wait(self):
         """Wait for the next backoff period"""
-        delay = min(self.base_delay * (self.factor**self.attempt), self.max_delay)
-        # Add jitter to prevent thundering herd
-        jitter = delay * 0.1 * (hash(id(asyncio.current_task())) % 10) / 10
-        await asyncio.sleep(delay + jitter)
-        self.attempt += 1
+        if self.factor == 2.0:
+            delay = math.ldexp(self.base_delay, self.attempt)
+        else:
+            delay = self.base_delay * (self.factor**self.attempt)
+        capped = delay >= self.max_delay
+        if capped:
+            delay = self.max_delay
+        if self.jitter:
+            # Spread retries by +/-50% so failing clients don't wake in lockstep
+            delay = min(delay * random.uniform(0.5, 1.5), self.max_delay)
+        await self._sleep(delay)
+        # Once capped, later waits are identical; stop attempt growing unbounded
+        if not capped:
+            self.attempt += 1
 
     def reset(self):
         """Reset the backoff counter"""
@@ -84,7 +186,7 @@ def validate_api_key(api_key: str) -> bool:
         raise ValueError("API key must be a string")
 
     # For tests: allow generic test keys OR enforce sk-sekha- prefix
-    if api_key.startswith("sk-test-"):
+    if api_key.startswith(_TEST_KEY_PREFIX):
         if len(api_key) < 20:
             raise ValueError(
                 "API key appears to be too short (min 20 characters for test keys)"
@@ -97,7 +199,7 @@ def validate_api_key(api_key: str) -> bool:
             "API key appears to be too short (must be at least 32 characters)"
         )
 
-    if not api_key.startswith("sk-sekha-"):
+    if not api_key.startswith(_VALID_PREFIX):
         raise ValueError("API key must start with 'sk-sekha-'")
 
     # Check for reasonable maximum length
@@ -120,8 +222,7 @@ def validate_base_url(url: str) -> bool:
         raise ValueError("Invalid base_url: malformed IPv6 address")
 
     # Basic URL validation - must have http:// or https://
-    url_pattern = r"^https?://[^\s/$.?#].[^\s]*$"
-    if not re.match(url_pattern, url, re.IGNORECASE):
+    if not _URL_RE.match(url):
         raise ValueError(
             "Invalid base_url: must be a valid URL starting with http:// or https://"
         )
@@ -131,19 +232,35 @@ def validate_base_url(url: str) -> bool:
 
 def parse_iso_datetime(dt_str: str) -> datetime:
     """Parse ISO 8601 datetime string to datetime object"""
-    # Try with microseconds first
+    if _parse_datetime is not None:
+        # C parser handles the Z suffix and space separator natively
+        try:
+            parsed: datetime = _parse_datetime(dt_str)
+        except ValueError:
+            # Same message as the fallback, whichever parser is installed
+            raise ValueError(f"Invalid isoformat string: {dt_str!r}") from None
+        return parsed
+
+    # fromisoformat before 3.11 rejects a trailing Z; strip it and attach UTC
+    utc = dt_str.endswith(("Z", "z"))
     try:
-        return datetime.fromisoformat(dt_str.replace("Z", "+00:00"))
+        dt = datetime.fromisoformat(dt_str[:-1] if utc else dt_str)
     except ValueError:
-        # Fallback to without microseconds
-        return datetime.strptime(dt_str, "%Y-%m-%d %H:%M:%S")
+        # Slow path for what fromisoformat before 3.11 rejects (".12", "+0530")
+        s = dt_str.replace(" ", "T", 1)
+        for fmt in _FALLBACK_FORMATS:
+            try:
+                return datetime.strptime(s, fmt)
+            except ValueError:
+                continue
+        raise ValueError(f"Invalid isoformat string: {dt_str!r}") from None
+    if utc and dt.tzinfo is None:
+        dt = dt.replace(tzinfo=_UTC)
+    return dt
 
 
 def format_bytes(n: int) -> str:
     """Format bytes to human readable format with correct logic"""
-    size = float(n)
-    for unit in ["B", "KB", "MB", "GB"]:
-        if size < 1024.0:
-            return f"{size:.1f} {unit}"
-        size /= 1024.0
-    return f"{size:.1f} TB"
+    # Each unit is 10 bits wider than the previous one; |n| < 1 stays in bytes
+    i = max(min((int(abs(n)).bit_length() - 1) // 10, len(_UNITS) - 1), 0)
+    return _TMPLS[i](n / (1 << (10 * i)))
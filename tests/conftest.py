@@ -0,0 +1,84 @@
+"""Shared fixtures for the test suite"""
+
+import functools
+import httpx
+import pytest
+from unittest.mock import Mock, AsyncMock
+
+from sekha import SekhaClient, ClientConfig
+
+from helpers import json_response, sleep_recorder
+
+# Built once at import; each test gets its own copy
+_DEFAULT_CONVERSATION = {
+    "id": "conv-123",
+    "label": "Test",
+    "folder": "/",
+    "status": "active",
+    "message_count": 1,
+    "created_at": "2025-12-30T10:00:00Z",
+    "updated_at": "2025-12-30T10:00:00Z",
+}
+
+
+@pytest.fixture(scope="session")
+def config():
+    """Test configuration (frozen, so safe to share)"""
+    return ClientConfig(
+        base_url="http://localhost:8080",
+        api_key="sk-sekha-test-12345678901234567890123456789012",
+        default_label="Test",
+    )
+
+
+@pytest.fixture(scope="module")
+async def shared_client(config):
+    """One SekhaClient per module; mock_client swaps its httpx stub per test"""
+    client = SekhaClient(config)
+    real_httpx = client.client
+    yield client
+    await real_httpx.aclose()
+
+
+@pytest.fixture
+def backoff_sleeps():
+    """Delays the client's retry backoff asked for; nothing really sleeps"""
+    return []
+
+
+@pytest.fixture
+def mock_client(shared_client, backoff_sleeps):
+    """Shared client with fresh per-test state and a mocked httpx"""
+    # Tests tweak or drain these, so never let them carry over
+    shared_client._reset_state()
+    shared_client.backoff._sleep = sleep_recorder(backoff_sleeps)
+
+    # Spec'd from the class, so no real AsyncClient is built per test
+    mock_httpx = AsyncMock(spec=httpx.AsyncClient)
+    default_response = json_response(dict(_DEFAULT_CONVERSATION))
+
+    mock_httpx.get = AsyncMock(return_value=default_response)
+    mock_httpx.post = AsyncMock(return_value=default_response)
+    mock_httpx.put = AsyncMock(return_value=default_response)
+    mock_httpx.delete = AsyncMock(return_value=default_response)
+
+    shared_client.client = mock_httpx
+    return shared_client
+
+
+@functools.lru_cache(maxsize=None)
+def _status_mocks(status, url, text):
+    """One request/response mock pair per (status, url, text); tests only read them"""
+    return Mock(url=url), Mock(status_code=status, text=text)
+
+
+def _status_error(status, url="http://localhost:8080/", text=""):
+    """Fresh HTTPStatusError per call so tracebacks don't pile up across raises"""
+    request, response = _status_mocks(status, url, text)
+    return httpx.HTTPStatusError(f"HTTP {status}", request=request, response=response)
+
+
+@pytest.fixture
+def http_error():
+    """Factory for httpx.HTTPStatusError with the given status code"""
+    return _status_error
@@ -0,0 +1,39 @@
+"""Shared helpers for building mocked httpx responses and test doubles"""
+
+from unittest.mock import NonCallableMock
+
+
+def _noop():
+    return None
+
+
+def json_response(payload, **attrs):
+    """Build a successful response whose json() returns payload
+
+    Plain functions stand in for raise_for_status/json, so the response
+    skips Mock's call-recording machinery. Extra attributes such as
+    status_code are set through configure_mock.
+    """
+    response = NonCallableMock()
+    response.configure_mock(**attrs)
+    response.raise_for_status = _noop
+    response.json = lambda: payload
+    return response
+
+
+def as_coro(value):
+    """Build a coroutine function returning value, for verbs never inspected"""
+
+    async def _f(*args, **kwargs):
+        return value
+
+    return _f
+
+
+def sleep_recorder(sleeps):
+    """Build a sleep_func that records each delay and returns immediately"""
+
+    async def _sleep(delay):
+        sleeps.append(delay)
+
+    return _sleep
@@ -2,8 +2,10 @@
 Tests for SekhaClient
 """
 
+import json
+import httpx
 import pytest
-from unittest.mock import Mock, AsyncMock
+from unittest.mock import Mock, AsyncMock, MagicMock
 from datetime import datetime
 
 from sekha import (
@@ -15,6 +17,8 @@ from sekha import (
     ClientConfig,
 )
 
+from helpers import as_coro
+
 
 @pytest.fixture
 def mock_client():
@@ -68,6 +72,11 @@ async def test_create_conversation(mock_client):
     assert result.label == "Test"
     assert mock_client.client.post.called
 
+    # Body is pre-serialized by Pydantic and sent as raw JSON bytes
+    call_args = mock_client.client.post.call_args
+    assert call_args[1]["headers"]["Content-Type"] == "application/json"
+    assert json.loads(call_args[1]["content"])["messages"][0]["role"] == "user"
+
 
 @pytest.mark.asyncio
 async def test_smart_query(mock_client):
@@ -95,7 +104,7 @@ async def test_smart_query(mock_client):
         }
     )
 
-    mock_client.client.post = AsyncMock(return_value=mock_response)
+    mock_client.client.post = as_coro(mock_response)
 
     result = await mock_client.smart_query("test query")
 
@@ -145,27 +154,27 @@ async def test_archive_conversation(mock_client):
 @pytest.mark.asyncio
 async def test_export_conversations(mock_client):
     """Test export functionality"""
-    # Setup mock for get
-    mock_response = Mock()
-    mock_response.raise_for_status = Mock()
-    mock_response.json = Mock(
-        return_value={
-            "content": "# Test Export\n\n## Conversation 1",
-            "format": "markdown",
-            "conversation_count": 1,
-        }
+    # Setup mock for the streamed markdown response
+    mock_response = httpx.Response(
+        200,
+        text="# Test Export\n\n## Conversation 1",
+        headers={"content-type": "text/markdown"},
+        request=httpx.Request("GET", "http://localhost:8080/api/v1/export"),
     )
+    mock_stream = MagicMock()
+    mock_stream.__aenter__.return_value = mock_response
 
-    mock_client.client.get = AsyncMock(return_value=mock_response)
+    mock_client.client.stream = Mock(return_value=mock_stream)
 
     # Test export
     result = await mock_client.export(label="Project:AI", format="markdown")
 
     assert result == "# Test Export\n\n## Conversation 1"
-    assert mock_client.client.get.called
-    call_args = mock_client.client.get.call_args
+    assert mock_client.client.stream.called
+    call_args = mock_client.client.stream.call_args
     assert call_args[1]["params"]["format"] == "markdown"
     assert call_args[1]["params"]["label"] == "Project:AI"
+    assert call_args[1]["headers"]["Accept"] == "text/markdown"
 
 
 @pytest.mark.asyncio
@@ -3,8 +3,10 @@ Complete integration tests for SekhaClient
 Tests all major API endpoints with realistic scenarios
 """
 
+import dataclasses
+import json
 import pytest
-from unittest.mock import Mock, AsyncMock
+from unittest.mock import Mock, AsyncMock, MagicMock
 from datetime import datetime
 import httpx
 
@@ -17,10 +19,15 @@ from sekha import (
     SekhaAPIError,
     SekhaAuthError,
     SekhaConnectionError,
+    SekhaError,
     SekhaNotFoundError,
     SekhaValidationError,
 )
 
+from helpers import as_coro, sleep_recorder
+
+_CONVERSATIONS_URL = "http://localhost:8080/api/v1/conversations"
+
 
 # ==================== Fixtures ====================
 
@@ -41,69 +48,48 @@ def memory(config):
     return SekhaClient(config)
 
 
+class _StubHTTPClient:
+    """Minimal stand-in for httpx.AsyncClient
+
+    Only the HTTP verbs are mocks, so the container itself skips Mock's
+    attribute machinery; tests override individual verbs as needed.
+    """
+
+    def __init__(self, response):
+        self.post = AsyncMock(return_value=response)
+        self.get = AsyncMock(return_value=response)
+        self.put = AsyncMock(return_value=response)
+        self.delete = AsyncMock(return_value=response)
+        self.stream = Mock()
+
+    async def aclose(self):
+        pass
+
+
 @pytest.fixture
-def mock_client():
+def mock_client(backoff_sleeps):
     """Create a client with mocked httpx - synchronous fixture"""
     config = ClientConfig(api_key="sk-sekha-test-12345678901234567890123456789012")
     client = SekhaClient(config)
-
-    # Create a mock that tracks calls but allows method assignment
-    mock_httpx_client = AsyncMock()
+    client.backoff._sleep = sleep_recorder(backoff_sleeps)
 
     # Set up default mock response
     default_response = Mock()
     default_response.raise_for_status = Mock()
-
-    # Make json dynamic to return what was sent
-    def dynamic_json():
-        # Try to get the request data
-        try:
-            call_args = mock_httpx_client.post.call_args
-            if call_args and len(call_args.args) > 0:
-                # For GET requests, check query params
-                if mock_httpx_client.get.called:
-                    get_args = mock_httpx_client.get.call_args
-                    if (
-                        "params" in get_args.kwargs
-                        and "label" in get_args.kwargs["params"]
-                    ):
-                        return {
-                            "content": f"# Test Export for {get_args.kwargs['params']['label']}\n\n## Conversation 1\n\nThis is the content.",
-                            "format": "markdown",
-                            "conversation_count": 1,
-                        }
-
-                # For POST requests, get the JSON body
-                if "json" in call_args.kwargs:
-                    request_data = call_args.kwargs["json"]
-                    label = request_data.get("label", "Test")
-                else:
-                    label = "Test"
-            else:
-                label = "Test"
-        except:
-            label = "Test"
-
-        return {
+    default_response.json = Mock(
+        return_value={
             "id": "conv-123",
-            "label": label,
+            "label": "Test",
             "folder": "/work",
             "status": "active",
             "message_count": 2,
             "created_at": datetime.now().isoformat(),
             "updated_at": datetime.now().isoformat(),
         }
+    )
 
-    default_response.json = dynamic_json
-
-    # Set default return values for all common methods
-    mock_httpx_client.post = AsyncMock(return_value=default_response)
-    mock_httpx_client.get = AsyncMock(return_value=default_response)
-    mock_httpx_client.put = AsyncMock(return_value=default_response)
-    mock_httpx_client.delete = AsyncMock(return_value=default_response)
-
-    # Replace the actual client with mock
-    client.client = mock_httpx_client
+    # Replace the actual client with the stub
+    client.client = _StubHTTPClient(default_response)
 
     return client  # Return the client directly, not a generator
 
@@ -130,10 +116,66 @@ class TestMemoryControllerInit:
         with pytest.raises(ValueError, match="Invalid base_url"):
             ClientConfig(api_key="sk-sekha-" + "x" * 32, base_url="not-a-url")
 
+    def test_connection_limits_ignore_rate_limit(self):
+        """Test the pool is usable even when the rate limit is zero"""
+        client = SekhaClient(
+            ClientConfig(
+                api_key="sk-sekha-test-12345678901234567890123456789012",
+                rate_limit_requests=0,
+                max_concurrent=8,
+            )
+        )
+        assert client._limits().max_connections == 8
+
+    def test_config_positional_fields_unchanged(self):
+        """Test new fields don't shift existing positional arguments"""
+        config = ClientConfig(
+            "sk-sekha-test-12345678901234567890123456789012",
+            "http://localhost:8080",
+            30.0,
+            3,
+            1000,
+            60.0,
+            "label",
+        )
+        assert config.default_label == "label"
+        assert config.max_concurrent == 64
+
+    def test_config_is_immutable(self, config):
+        """Test config cannot be changed after validation"""
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.timeout = -1
+
     def test_init_with_default_label(self, config):
         """Test config includes default_label"""
         assert config.default_label == "Test"
 
+    def test_init_connection_limits(self, config):
+        """Test connection pool is sized from max_concurrent"""
+        client = SekhaClient(config)
+        limits = client._limits()
+        assert limits.max_connections == config.max_concurrent
+        assert limits.max_keepalive_connections == config.max_concurrent
+        assert limits.keepalive_expiry == 30.0
+
+    def test_init_semaphore_is_lazy(self, config):
+        """Test the semaphore is only built once a request needs it"""
+        client = SekhaClient(config)
+        assert client._sem is None
+        assert client._semaphore is client._semaphore
+        assert client._semaphore._value == config.max_concurrent
+
+    def test_init_shared_headers(self, config):
+        """Test async and sync clients send the same static headers"""
+        client = SekhaClient(config)
+        assert client._headers["Authorization"] == f"Bearer {config.api_key}"
+        assert client.client.headers["User-Agent"] == "Sekha-Python-SDK/0.5.0"
+        assert (
+            client.sync_client.headers["Authorization"]
+            == client.client.headers["Authorization"]
+        )
+        client.sync_client.close()
+
 
 # ==================== Conversation Creation Tests ====================
 
@@ -153,6 +195,20 @@ class TestCreateConversation:
             ],
         )
 
+        mock_response = Mock()
+        mock_response.raise_for_status = Mock()
+        mock_response.json = Mock(
+            return_value={
+                "id": "conv-123",
+                "label": "Test Conversation",
+                "folder": "/work",
+                "status": "active",
+                "message_count": 2,
+                "created_at": datetime.now().isoformat(),
+            }
+        )
+        mock_client.client.post = AsyncMock(return_value=mock_response)
+
         result = await mock_client.create_conversation(conv)
 
         assert result.label == "Test Conversation"
@@ -171,23 +227,12 @@ class TestCreateConversation:
         assert result.id == "conv-123"
 
     @pytest.mark.asyncio
-    async def test_create_conversation_auth_error(self, config):
+    async def test_create_conversation_auth_error(self, config, http_error):
         """Test 401 error handling"""
         # Create a real client but mock the httpx client directly
         client = SekhaClient(config)
 
-        error_response = Mock()
-        error_response.status_code = 401
-        error_response.text = "Invalid API key"
-
-        # Create a proper httpx request mock
-        request_mock = Mock()
-        request_mock.url = "http://localhost:8080/api/v1/conversations"
-
-        # Create the HTTPStatusError
-        auth_error = httpx.HTTPStatusError(
-            "Unauthorized", request=request_mock, response=error_response
-        )
+        auth_error = http_error(401, _CONVERSATIONS_URL, "Invalid API key")
 
         # Mock the client's httpx client
         client.client = AsyncMock()
@@ -201,16 +246,10 @@ class TestCreateConversation:
             await client.create_conversation(conv)
 
     @pytest.mark.asyncio
-    async def test_400_bad_request(self, mock_client):
+    async def test_400_bad_request(self, mock_client, http_error):
         """Test 400 error handling"""
-        error_response = Mock()
-        error_response.status_code = 400
-        error_response.text = "Invalid request payload"
-
         mock_client.client.post = AsyncMock(
-            side_effect=httpx.HTTPStatusError(
-                "Bad Request", request=Mock(), response=error_response
-            )
+            side_effect=http_error(400, text="Invalid request payload")
         )
 
         conv = NewConversation(
@@ -222,17 +261,9 @@ class TestCreateConversation:
             await mock_client.create_conversation(conv)
 
     @pytest.mark.asyncio
-    async def test_429_rate_limit(self, mock_client):
+    async def test_429_rate_limit(self, mock_client, http_error):
         """Test rate limit error handling"""
-        error_response = Mock()
-        error_response.status_code = 429
-        error_response.headers = {"Retry-After": "60"}
-
-        mock_client.client.post = AsyncMock(
-            side_effect=httpx.HTTPStatusError(
-                "Too Many Requests", request=Mock(), response=error_response
-            )
-        )
+        mock_client.client.post = AsyncMock(side_effect=http_error(429))
 
         conv = NewConversation(
             label="Test", messages=[MessageDto(role=MessageRole.USER, content="Test")]
@@ -273,7 +304,7 @@ class TestSmartQuery:
             }
         )
 
-        mock_client.client.post = AsyncMock(return_value=mock_response)
+        mock_client.client.post = as_coro(mock_response)
 
         result = await mock_client.smart_query(
             query="How to handle authentication?",
@@ -299,13 +330,128 @@ class TestSmartQuery:
             }
         )
 
-        mock_client.client.post = AsyncMock(return_value=mock_response)
+        mock_client.client.post = as_coro(mock_response)
 
         result = await mock_client.smart_query(query="non-existent topic")
 
         assert result.total == 0
         assert len(result.results) == 0
 
+    @pytest.mark.asyncio
+    async def test_smart_query_stream(self, mock_client):
+        """Test streaming smart query results as NDJSON"""
+        lines = [
+            json.dumps(
+                {
+                    "conversation_id": f"conv-{i}",
+                    "message_id": f"msg-{i}",
+                    "score": 0.9,
+                    "content": f"Result {i}",
+                    "label": "Project:Auth",
+                    "folder": "/work",
+                    "timestamp": "2025-12-30T10:00:00Z",
+                }
+            )
+            for i in range(3)
+        ]
+        mock_response = httpx.Response(
+            200,
+            text="\n".join(lines) + "\n",
+            headers={"content-type": "application/x-ndjson"},
+            request=httpx.Request("POST", "http://localhost:8080/api/v1/query/smart"),
+        )
+        mock_stream = MagicMock()
+        mock_stream.__aenter__.return_value = mock_response
+
+        mock_client.client.stream = Mock(return_value=mock_stream)
+
+        results = [r async for r in mock_client.smart_query_stream("auth", limit=3)]
+
+        assert [r.content for r in results] == ["Result 0", "Result 1", "Result 2"]
+        call_args = mock_client.client.stream.call_args
+        assert call_args[1]["headers"]["Accept"] == "application/x-ndjson"
+        assert json.loads(call_args[1]["content"])["limit"] == 3
+
+    @pytest.mark.asyncio
+    async def test_smart_query_stream_json_fallback(self, mock_client):
+        """Test streaming from a server that returns a regular JSON response"""
+        mock_response = httpx.Response(
+            200,
+            json={
+                "results": [
+                    {
+                        "conversation_id": "conv-1",
+                        "message_id": "msg-1",
+                        "score": 0.5,
+                        "content": "Only result",
+                        "label": "Test",
+                        "folder": "/",
+                        "timestamp": "2025-12-30T10:00:00Z",
+                    }
+                ],
+                "total": 1,
+                "page": 1,
+                "page_size": 10,
+            },
+            request=httpx.Request("POST", "http://localhost:8080/api/v1/query/smart"),
+        )
+        mock_stream = MagicMock()
+        mock_stream.__aenter__.return_value = mock_response
+
+        mock_client.client.stream = Mock(return_value=mock_stream)
+
+        results = [r async for r in mock_client.smart_query_stream("test")]
+
+        assert len(results) == 1
+        assert results[0].content == "Only result"
+
+    @pytest.mark.asyncio
+    async def test_smart_query_stream_error(self, mock_client):
+        """Test API error while streaming a smart query"""
+        mock_response = httpx.Response(
+            400,
+            text="Bad query",
+            request=httpx.Request("POST", "http://localhost:8080/api/v1/query/smart"),
+        )
+        mock_stream = MagicMock()
+        mock_stream.__aenter__.return_value = mock_response
+
+        mock_client.client.stream = Mock(return_value=mock_stream)
+
+        with pytest.raises(SekhaValidationError):
+            async for _ in mock_client.smart_query_stream("test"):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_smart_query_stream_connection_error(self, mock_client):
+        """Test a connection failure maps to SekhaConnectionError"""
+        mock_stream = MagicMock()
+        mock_stream.__aenter__.side_effect = httpx.ConnectError("Connection refused")
+
+        mock_client.client.stream = Mock(return_value=mock_stream)
+
+        with pytest.raises(SekhaConnectionError, match="Connection failed"):
+            async for _ in mock_client.smart_query_stream("test"):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_smart_query_stream_malformed_line(self, mock_client):
+        """Test an invalid NDJSON line maps to SekhaError"""
+        mock_response = httpx.Response(
+            200,
+            text='{"conversation_id": "conv-1"}\n',
+            headers={"content-type": "application/x-ndjson"},
+            request=httpx.Request("POST", "http://localhost:8080/api/v1/query/smart"),
+        )
+        mock_stream = MagicMock()
+        mock_stream.__aenter__.return_value = mock_response
+
+        mock_client.client.stream = Mock(return_value=mock_stream)
+
+        with pytest.raises(SekhaError, match="Smart query failed"):
+            async for _ in mock_client.smart_query_stream("test"):
+                pass
+
 
 # ==================== Memory Management Tests ====================
 
@@ -369,23 +515,43 @@ class TestExport:
     @pytest.mark.asyncio
     async def test_export_markdown(self, mock_client):
         """Test markdown export"""
-        mock_response = Mock()
-        mock_response.raise_for_status = Mock()
-        mock_response.json = Mock(
-            return_value={
-                "content": "# Test Export\n\n## Conversation 1\n\nThis is the content.",
-                "format": "markdown",
-                "conversation_count": 1,
-            }
+        mock_response = httpx.Response(
+            200,
+            text="# Test Export\n\n## Conversation 1\n\nThis is the content.",
+            headers={"content-type": "text/markdown"},
+            request=httpx.Request("GET", "http://localhost:8080/api/v1/export"),
         )
+        mock_stream = MagicMock()
+        mock_stream.__aenter__.return_value = mock_response
 
-        mock_client.client.get = AsyncMock(return_value=mock_response)
+        mock_client.client.stream = Mock(return_value=mock_stream)
 
         result = await mock_client.export(label="Project:AI", format="markdown")
 
         assert result.startswith("# Test Export")
         assert "conversation 1" in result.lower()
 
+    @pytest.mark.asyncio
+    async def test_export_markdown_json_envelope(self, mock_client):
+        """Test markdown export from a server that ignores the Accept header"""
+        mock_response = httpx.Response(
+            200,
+            json={
+                "content": "# Test Export",
+                "format": "markdown",
+                "conversation_count": 1,
+            },
+            request=httpx.Request("GET", "http://localhost:8080/api/v1/export"),
+        )
+        mock_stream = MagicMock()
+        mock_stream.__aenter__.return_value = mock_response
+
+        mock_client.client.stream = Mock(return_value=mock_stream)
+
+        result = await mock_client.export(format="markdown")
+
+        assert result == "# Test Export"
+
     @pytest.mark.asyncio
     async def test_export_json(self, mock_client):
         """Test JSON export"""
@@ -399,7 +565,7 @@ class TestExport:
             }
         )
 
-        mock_client.client.get = AsyncMock(return_value=mock_response)
+        mock_client.client.get = as_coro(mock_response)
 
         result = await mock_client.export(format="json")
 
@@ -443,7 +609,7 @@ class TestPruning:
             ]
         )
 
-        mock_client.client.get = AsyncMock(return_value=mock_response)
+        mock_client.client.get = as_coro(mock_response)
 
         suggestions = await mock_client.get_pruning_suggestions(
             threshold_days=90, importance_threshold=3.0
@@ -461,19 +627,13 @@ class TestErrorHandling:
     """Test comprehensive error scenarios"""
 
     @pytest.mark.asyncio
-    async def test_400_bad_request(self, mock_client):
+    async def test_400_bad_request(self, mock_client, http_error):
         """Test 400 error handling"""
-        error_response = Mock()
-        error_response.status_code = 400
-        error_response.text = "Invalid request payload"
-
-        # Create proper request mock
-        request_mock = Mock()
-        request_mock.url = "http://localhost:8080/api/v1/conversations"
-
         mock_client.client.post = AsyncMock(
-            side_effect=httpx.HTTPStatusError(
-                "Bad Request", request=request_mock, response=error_response
+            side_effect=http_error(
+                400,
+                _CONVERSATIONS_URL,
+                "Invalid request payload",
             )
         )
 
@@ -486,34 +646,18 @@ class TestErrorHandling:
             await mock_client.create_conversation(conv)
 
     @pytest.mark.asyncio
-    async def test_404_not_found(self, mock_client):
+    async def test_404_not_found(self, mock_client, http_error):
         """Test 404 error handling"""
-        error_response = Mock()
-        error_response.status_code = 404
-
-        mock_client.client.get = AsyncMock(
-            side_effect=httpx.HTTPStatusError(
-                "Not Found", request=Mock(), response=error_response
-            )
-        )
+        mock_client.client.get = AsyncMock(side_effect=http_error(404))
 
         with pytest.raises(SekhaNotFoundError):
             await mock_client.get_conversation("non-existent")
 
     @pytest.mark.asyncio
-    async def test_429_rate_limit(self, mock_client):
+    async def test_429_rate_limit(self, mock_client, http_error):
         """Test rate limit error handling"""
-        error_response = Mock()
-        error_response.status_code = 429
-        error_response.headers = {"Retry-After": "60"}
-
-        request_mock = Mock()
-        request_mock.url = "http://localhost:8080/api/v1/conversations"
-
         mock_client.client.post = AsyncMock(
-            side_effect=httpx.HTTPStatusError(
-                "Too Many Requests", request=request_mock, response=error_response
-            )
+            side_effect=http_error(429, _CONVERSATIONS_URL)
         )
 
         conv = NewConversation(
@@ -529,22 +673,23 @@ class TestErrorBranches:
     """Test specific error handling branches"""
 
     @pytest.mark.asyncio
-    async def test_get_conversation_not_found(self, mock_client):
+    async def test_get_conversation_not_found(self, mock_client, http_error):
         """Test 404 on get_conversation"""
-        error_response = Mock()
-        error_response.status_code = 404
-
-        mock_client.client.get = AsyncMock(
-            side_effect=httpx.HTTPStatusError(
-                "Not Found", request=Mock(), response=error_response
-            )
-        )
+        mock_client.client.get = AsyncMock(side_effect=http_error(404))
 
         with pytest.raises(SekhaNotFoundError):
             await mock_client.get_conversation("non-existent")
 
     @pytest.mark.asyncio
-    async def test_smart_query_connection_error(self, mock_client):
+    async def test_list_conversations_auth_error(self, mock_client, http_error):
+        """Test 401 maps to SekhaAuthError on every endpoint"""
+        mock_client.client.get = AsyncMock(side_effect=http_error(401))
+
+        with pytest.raises(SekhaAuthError, match="Invalid API key"):
+            await mock_client.list_conversations()
+
+    @pytest.mark.asyncio
+    async def test_smart_query_connection_error(self, mock_client, backoff_sleeps):
         """Test connection error in smart_query"""
         mock_client.client.post = AsyncMock(
             side_effect=httpx.ConnectError("Connection failed")
@@ -553,21 +698,32 @@ class TestErrorBranches:
         with pytest.raises(SekhaConnectionError):
             await mock_client.smart_query("test query")
 
+        assert len(backoff_sleeps) == mock_client.config.max_retries
+
     @pytest.mark.asyncio
-    async def test_export_invalid_format(self, mock_client):
+    async def test_export_invalid_format(self, mock_client, http_error):
         """Test export with invalid format parameter"""
-        error_response = Mock()
-        error_response.status_code = 400
-
-        mock_client.client.get = AsyncMock(
-            side_effect=httpx.HTTPStatusError(
-                "Bad Request", request=Mock(), response=error_response
-            )
-        )
+        mock_client.client.get = AsyncMock(side_effect=http_error(400))
 
         with pytest.raises(SekhaValidationError):
             await mock_client.export(format="invalid")
 
+    @pytest.mark.asyncio
+    async def test_export_markdown_server_error(self, mock_client):
+        """Test server error while streaming a markdown export"""
+        mock_response = httpx.Response(
+            500,
+            text="Internal Server Error",
+            request=httpx.Request("GET", "http://localhost:8080/api/v1/export"),
+        )
+        mock_stream = MagicMock()
+        mock_stream.__aenter__.return_value = mock_response
+
+        mock_client.client.stream = Mock(return_value=mock_stream)
+
+        with pytest.raises(SekhaAPIError, match="500"):
+            await mock_client.export(format="markdown")
+
 
 # ==================== Async Context Manager Tests ====================
 
@@ -1,127 +1,257 @@
 """Tests for untested client methods"""
 
+import asyncio
+import json
+import httpx
 import pytest
 from unittest.mock import Mock, AsyncMock
-from sekha import SekhaClient, ClientConfig
+from sekha import (
+    SekhaClient,
+    ClientConfig,
+    NewConversation,
+    SekhaConnectionError,
+    SekhaError,
+)
 
+from helpers import json_response
 
-@pytest.fixture
-def mock_client():
-    config = ClientConfig(api_key="sk-sekha-test-12345678901234567890123456789012")
-    client = SekhaClient(config)
+# ============== Untested Methods ==============
 
-    # Mock the httpx client
-    mock_httpx = AsyncMock()
-    default_response = Mock()
-    default_response.raise_for_status = Mock()
-    default_response.json = Mock(
-        return_value={
-            "id": "conv-123",
-            "label": "Test",
-            "folder": "/",
-            "status": "active",
-            "message_count": 1,
-            "created_at": "2025-12-30T10:00:00Z",
-            "updated_at": "2025-12-30T10:00:00Z",
-        }
+
+async def test_create_conversations_bulk(mock_client):
+    mock_response = json_response(
+        [
+            {
+                "id": f"conv-{i}",
+                "label": "Bulk",
+                "folder": "/",
+                "status": "active",
+                "message_count": 1,
+                "created_at": "2025-12-30T10:00:00Z",
+            }
+            for i in range(3)
+        ],
+        status_code=200,
     )
+    mock_client.client.post.return_value = mock_response
 
-    mock_httpx.get = AsyncMock(return_value=default_response)
-    mock_httpx.delete = AsyncMock(return_value=default_response)
-    mock_httpx.post = AsyncMock(return_value=default_response)
+    convs = [NewConversation(label="Bulk") for _ in range(3)]
+    result = await mock_client.create_conversations_bulk(convs)
 
-    client.client = mock_httpx
-    return client
+    assert [c.id for c in result] == ["conv-0", "conv-1", "conv-2"]
+    assert mock_client.client.post.call_count == 1
+    call_args = mock_client.client.post.call_args
+    assert call_args[0][0] == "/api/v1/conversations:batch"
+    assert len(json.loads(call_args[1]["content"])) == 3
 
 
-# At the top level, add:
-@pytest.fixture
-def config():
-    """Test configuration"""
-    return ClientConfig(
-        base_url="http://localhost:8080",
-        api_key="sk-sekha-test-12345678901234567890123456789012",
-        default_label="Test",
+async def test_create_conversations_bulk_fallback(mock_client):
+    # Server without the batch endpoint: one request per conversation
+    result_response = mock_client.client.post.return_value
+    mock_client.client.post = AsyncMock(
+        side_effect=[Mock(status_code=404)] + [result_response] * 2
     )
 
+    convs = [NewConversation(label="Bulk") for _ in range(2)]
+    result = await mock_client.create_conversations_bulk(convs)
 
-@pytest.mark.asyncio
-async def test_async_context_manager_cleanup(config):
-    """Test proper resource cleanup in async context manager"""
-    client = SekhaClient(config)
-    async with client:
-        assert client.client is not None
+    assert [c.id for c in result] == ["conv-123", "conv-123"]
+    assert mock_client.client.post.call_count == 3
+    assert await mock_client.create_conversations_bulk([]) == []
 
-    # After exit, should be closed
-    await client.close()  # Explicit close for cleanup
+    # The missing batch endpoint is not probed again
+    mock_client.client.post = AsyncMock(return_value=result_response)
+    await mock_client.create_conversations_bulk(convs)
+    assert mock_client.client.post.call_count == 2
 
 
-# ============== Untested Methods ==============
+@pytest.mark.parametrize(
+    "error", [httpx.TimeoutException("Timeout"), httpx.ConnectError("Refused")]
+)
+async def test_create_conversations_bulk_connection_error(mock_client, error):
+    mock_client.client.post = AsyncMock(side_effect=error)
+
+    with pytest.raises(SekhaConnectionError):
+        await mock_client.create_conversations_bulk([NewConversation(label="Bulk")])
 
 
-@pytest.mark.asyncio
 async def test_get_conversation(mock_client):
     result = await mock_client.get_conversation("conv-123")
     assert result.id == "conv-123"
     assert mock_client.client.get.called
 
 
-@pytest.mark.asyncio
 async def test_list_conversations(mock_client):
     result = await mock_client.list_conversations(label="Work", page=1, page_size=10)
     assert isinstance(result, list)
     assert mock_client.client.get.called
 
 
-@pytest.mark.asyncio
+def _conversation_page(ids, total=None):
+    data = {
+        "results": [
+            {
+                "id": conv_id,
+                "label": "Work",
+                "folder": "/",
+                "status": "active",
+                "message_count": 1,
+                "created_at": "2025-12-30T10:00:00Z",
+            }
+            for conv_id in ids
+        ]
+    }
+    if total is not None:
+        data["total"] = total
+    return json_response(data)
+
+
+async def test_iter_conversations(mock_client):
+    pages = {
+        1: _conversation_page(["c1", "c2"], total=5),
+        2: _conversation_page(["c3", "c4"], total=5),
+        3: _conversation_page(["c5"], total=5),
+    }
+    mock_client.client.get = AsyncMock(
+        side_effect=lambda url, params: pages[params["page"]]
+    )
+
+    result = [c.id async for c in mock_client.iter_conversations(page_size=2)]
+
+    assert result == ["c1", "c2", "c3", "c4", "c5"]
+    assert mock_client.client.get.call_count == 3
+
+
+async def test_iter_conversations_yields_per_window(mock_client):
+    pages = {page: _conversation_page([f"c{page}"], total=5) for page in range(1, 6)}
+    requested = []
+
+    def get(url, params):
+        requested.append(params["page"])
+        return pages[params["page"]]
+
+    mock_client.client.get = AsyncMock(side_effect=get)
+
+    seen = []
+    async for conv in mock_client.iter_conversations(page_size=1, concurrency=2):
+        seen.append((conv.id, list(requested)))
+
+    # Pages 4-5 are only requested once the 2-3 window has been yielded
+    assert seen[1] == ("c2", [1, 2, 3])
+    assert seen[2] == ("c3", [1, 2, 3])
+    assert seen[-1] == ("c5", [1, 2, 3, 4, 5])
+
+
+@pytest.mark.parametrize("body", [{"results": [{"id": 1}]}, ["not", "a", "dict"]])
+async def test_list_conversations_malformed_page(mock_client, body):
+    mock_client.client.get.return_value = json_response(body)
+
+    with pytest.raises(SekhaError, match="Failed to list conversations"):
+        await mock_client.list_conversations()
+
+    with pytest.raises(SekhaError, match="Failed to list conversations"):
+        async for _ in mock_client.iter_conversations():
+            pass
+
+
+async def test_iter_conversations_without_total(mock_client):
+    pages = {
+        1: _conversation_page(["c1", "c2"]),
+        2: _conversation_page(["c3"]),
+    }
+    mock_client.client.get = AsyncMock(
+        side_effect=lambda url, params: pages[params["page"]]
+    )
+
+    result = [
+        c.id async for c in mock_client.iter_conversations(label="Work", page_size=2)
+    ]
+
+    assert result == ["c1", "c2", "c3"]
+    assert mock_client.client.get.call_args[1]["params"]["label"] == "Work"
+
+
+async def test_max_concurrent_requests():
+    config = ClientConfig(
+        api_key="sk-sekha-test-12345678901234567890123456789012",
+        max_concurrent=2,
+    )
+    client = SekhaClient(config)
+    in_flight = 0
+    peak = 0
+
+    async def slow_get(url):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return json_response([])
+
+    client.client = AsyncMock()
+    client.client.get = slow_get
+
+    await asyncio.gather(*(client.get_mcp_tools() for _ in range(6)))
+
+    assert peak == 2
+
+
+def test_max_concurrent_must_be_positive():
+    with pytest.raises(ValueError, match="max_concurrent"):
+        ClientConfig(
+            api_key="sk-sekha-test-12345678901234567890123456789012",
+            max_concurrent=0,
+        )
+
+
+@pytest.mark.parametrize("window", [0, -1.0])
+def test_rate_limit_window_must_be_positive(window):
+    with pytest.raises(ValueError, match="rate_limit_window"):
+        ClientConfig(
+            api_key="sk-sekha-test-12345678901234567890123456789012",
+            rate_limit_window=window,
+        )
+
+
 async def test_delete_conversation(mock_client):
     await mock_client.delete_conversation("conv-123")
     assert mock_client.client.delete.called
 
 
-@pytest.mark.asyncio
 async def test_score_message_importance(mock_client):
-    mock_response = Mock()
-    mock_response.raise_for_status = Mock()
-    mock_response.json = Mock(
-        return_value={
+    mock_response = json_response(
+        {
             "score": 8.5,
             "reasoning": "Critical security information",
             "model": "gpt-4",
         }
     )
-    mock_client.client.post = AsyncMock(return_value=mock_response)
+    mock_client.client.post.return_value = mock_response
 
     result = await mock_client.score_message_importance("msg-456")
     assert result.score == 8.5
     assert result.model == "gpt-4"
 
 
-@pytest.mark.asyncio
 async def test_generate_summary(mock_client):
-    mock_response = Mock()
-    mock_response.raise_for_status = Mock()
-    mock_response.json = Mock(
-        return_value={
+    mock_response = json_response(
+        {
             "summary": "Conversation summary",
             "tokens_used": 150,  # Changed from token_count
             "level": "daily",  # Must be enum value
             "model": "gpt-4",  # Required field
         }
     )
-    mock_client.client.post = AsyncMock(return_value=mock_response)
+    mock_client.client.post.return_value = mock_response
 
     result = await mock_client.generate_summary("conv-123")
     assert result.summary == "Conversation summary"
     assert result.tokens_used == 150
 
 
-@pytest.mark.asyncio
 async def test_suggest_labels(mock_client):
-    mock_response = Mock()
-    mock_response.raise_for_status = Mock()
-    mock_response.json = Mock(
-        return_value=[
+    mock_response = json_response(
+        [
             {
                 "label": "Project:AI",
                 "confidence": 0.92,
@@ -130,7 +260,7 @@ async def test_suggest_labels(mock_client):
             }
         ]
     )
-    mock_client.client.post = AsyncMock(return_value=mock_response)
+    mock_client.client.post.return_value = mock_response
 
     result = await mock_client.suggest_labels("conv-123")
     assert len(result) == 1
@@ -138,13 +268,10 @@ async def test_suggest_labels(mock_client):
     assert result[0].confidence > 0.9
 
 
-@pytest.mark.asyncio
 async def test_auto_label_threshold_not_met(mock_client):
     # Setup: low confidence suggestion
-    mock_response = Mock()
-    mock_response.raise_for_status = Mock()
-    mock_response.json = Mock(
-        return_value=[
+    mock_response = json_response(
+        [
             {
                 "label": "Uncertain",
                 "confidence": 0.5,
@@ -153,20 +280,20 @@ async def test_auto_label_threshold_not_met(mock_client):
             }
         ]
     )
-    mock_client.client.post = AsyncMock(return_value=mock_response)
-    mock_client.client.put = AsyncMock(return_value=Mock())
+    # Server without the auto-label endpoint: fall back to suggest + update
+    mock_client.client.post = AsyncMock(
+        side_effect=[Mock(status_code=404), mock_response]
+    )
+    mock_client.client.put.return_value = Mock()
 
     result = await mock_client.auto_label("conv-123", threshold=0.8)
     assert result is None  # No label applied
 
 
-@pytest.mark.asyncio
 async def test_auto_label_threshold_met(mock_client):
     # Setup: high confidence suggestion
-    mock_response = Mock()
-    mock_response.raise_for_status = Mock()
-    mock_response.json = Mock(
-        return_value=[
+    mock_response = json_response(
+        [
             {
                 "label": "High Confidence",
                 "confidence": 0.95,
@@ -175,50 +302,87 @@ async def test_auto_label_threshold_met(mock_client):
             }
         ]
     )
-    mock_client.client.post = AsyncMock(return_value=mock_response)
-    mock_client.client.put = AsyncMock(return_value=Mock())
+    # Server without the auto-label endpoint: fall back to suggest + update
+    mock_client.client.post = AsyncMock(
+        side_effect=[Mock(status_code=404), mock_response]
+    )
+    mock_client.client.put.return_value = Mock()
 
     result = await mock_client.auto_label("conv-123", threshold=0.8)
     assert result == "High Confidence"
+    assert mock_client.client.put.called
+
+    # The missing endpoint is remembered: next call goes straight to suggest
+    mock_client.client.post = AsyncMock(return_value=mock_response)
+    assert await mock_client.auto_label("conv-456") == "High Confidence"
+    assert mock_client.client.post.call_count == 1
+    assert mock_client.client.post.call_args[0][0].endswith("/suggest-labels")
+
+
+async def test_auto_label_not_found_conversation_keeps_probing(mock_client, http_error):
+    # 404 from both endpoints means the conversation is missing, not the endpoint
+    mock_client.client.post = AsyncMock(
+        side_effect=[Mock(status_code=404), http_error(404)]
+    )
+
+    with pytest.raises(SekhaError):
+        await mock_client.auto_label("missing")
+    assert not mock_client._missing_endpoints
+
+
+async def test_auto_label_timeout(mock_client):
+    mock_client.client.post = AsyncMock(side_effect=httpx.TimeoutException("Timeout"))
+
+    with pytest.raises(SekhaError, match="Auto-label failed"):
+        await mock_client.auto_label("conv-123")
+
+
+async def test_auto_label_single_round_trip(mock_client):
+    mock_response = json_response({"label": "Work"}, status_code=200)
+    mock_client.client.post.return_value = mock_response
+
+    result = await mock_client.auto_label("conv-123", threshold=0.8)
+    assert result == "Work"
+    assert mock_client.client.post.call_count == 1
+    assert mock_client.client.post.call_args[1]["params"] == {"threshold": 0.8}
+    assert not mock_client.client.put.called
 
 
-@pytest.mark.asyncio
 async def test_get_mcp_tools(mock_client):
-    mock_response = Mock()
-    mock_response.raise_for_status = Mock()
-    mock_response.json = Mock(
-        return_value=[
-            {"name": "search_memory", "description": "Search conversation memory"}
-        ]
+    mock_response = json_response(
+        [{"name": "search_memory", "description": "Search conversation memory"}]
     )
-    mock_client.client.get = AsyncMock(return_value=mock_response)
+    mock_client.client.get.return_value = mock_response
 
     result = await mock_client.get_mcp_tools()
     assert len(result) == 1
     assert result[0]["name"] == "search_memory"
 
 
-# ============== SyncSekhaClient Tests ==============
+# ============== Context Manager Tests ==============
 
 
-def test_sync_client_wrapper(config):
-    """Test SyncSekhaClient wraps async methods"""
-    from sekha.client import SyncSekhaClient
+async def test_async_context_manager_cleanup(config):
+    """Test proper resource cleanup"""
+    client = SekhaClient(config)
+    client.client = AsyncMock()
 
-    sync_client = SyncSekhaClient(config)
+    async with client:
+        assert client.client is not None
 
-    # Test that it has async method names
-    assert hasattr(sync_client, "create_conversation")
-    assert hasattr(sync_client, "smart_query")
+    # After exit, the pooled httpx client should be closed
+    client.client.aclose.assert_awaited_once()
 
-    sync_client._async_client.close()  # Cleanup
 
+def test_reset_state_rebuilds_request_state(config):
+    client = SekhaClient(config)
+    limiter, backoff = client.rate_limiter, client.backoff
+    client._missing_endpoints.add("batch")
+    client._semaphore
 
-@pytest.mark.asyncio
-async def test_async_context_manager_cleanup(config):
-    """Test proper resource cleanup"""
-    async with SekhaClient(config) as client:
-        assert client.client is not None
+    client._reset_state()
 
-    # After exit, client should be closed
-    # (This would raise an error if used, which is expected)
+    assert client.rate_limiter is not limiter
+    assert client.backoff is not backoff
+    assert client._sem is None
+    assert client._missing_endpoints == set()
@@ -1,5 +1,7 @@
 """Tests for custom exceptions"""
 
+import pytest
+
 from sekha.errors import (
     SekhaError,
     SekhaAPIError,
@@ -29,41 +31,18 @@ class TestSekhaAPIError:
         assert isinstance(error, SekhaError)
 
 
-class TestSekhaNotFoundError:
-    def test_not_found_error(self):
-        """Test not found error"""
-        error = SekhaNotFoundError("Conversation not found")
-        assert "not found" in str(error)
-        assert isinstance(error, SekhaError)
-
-
-class TestSekhaAuthError:
-    def test_auth_error(self):
-        """Test authentication error"""
-        error = SekhaAuthError("Invalid API key")
-        assert "Invalid API key" in str(error)
-        assert isinstance(error, SekhaError)
-
-
-class TestSekhaConnectionError:
-    def test_connection_error(self):
-        """Test connection error"""
-        error = SekhaConnectionError("Cannot connect to server")
-        assert "connect" in str(error).lower()
-        assert isinstance(error, SekhaError)
-
-
-class TestSekhaValidationError:
-    def test_validation_error(self):
-        """Test validation error"""
-        error = SekhaValidationError("Invalid input data")
-        assert "Invalid" in str(error)
-        assert isinstance(error, SekhaError)
-
-
-class TestSekhaRateLimitError:
-    def test_rate_limit_error(self):
-        """Test rate limit error"""
-        error = SekhaRateLimitError("Rate limit exceeded")
-        assert "limit" in str(error).lower()
-        assert isinstance(error, SekhaError)
+@pytest.mark.parametrize(
+    "cls,msg,needle",
+    [
+        (SekhaNotFoundError, "Conversation not found", "not found"),
+        (SekhaAuthError, "Invalid API key", "invalid api key"),
+        (SekhaConnectionError, "Cannot connect to server", "connect"),
+        (SekhaValidationError, "Invalid input data", "invalid"),
+        (SekhaRateLimitError, "Rate limit exceeded", "limit"),
+    ],
+)
+def test_error_message(cls, msg, needle):
+    """Test each error keeps its message and inherits from SekhaError"""
+    error = cls(msg)
+    assert needle in str(error).lower()
+    assert isinstance(error, SekhaError)
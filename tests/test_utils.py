@@ -2,7 +2,9 @@
 
 import pytest
 import asyncio
+import random
 
+from sekha import utils
 from sekha.utils import (
     RateLimiter,
     ExponentialBackoff,
@@ -13,64 +15,94 @@ from sekha.utils import (
 )
 
 
+@pytest.fixture(params=["ciso8601", "fallback"])
+def iso_parser(request, monkeypatch):
+    """Run the datetime tests against both parse_iso_datetime backends"""
+    if request.param == "ciso8601":
+        ciso8601 = pytest.importorskip("ciso8601")
+        monkeypatch.setattr(utils, "_parse_datetime", ciso8601.parse_datetime)
+    else:
+        monkeypatch.setattr(utils, "_parse_datetime", None)
+
+
+class FakeClock:
+    """Manual clock whose sleep advances time instantly and records the delay"""
+
+    def __init__(self):
+        self.t = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.t
+
+    async def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.t += seconds
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+def clock():
+    """Fresh fake clock; pass it as time_func and clock.sleep as sleep_func"""
+    return FakeClock()
+
+
 class TestRateLimiter:
-    @pytest.mark.asyncio
-    async def test_rate_limiter_acquire(self):
+    async def test_rate_limiter_acquire(self, clock):
         """Test basic rate limiting functionality"""
-        limiter = RateLimiter(max_requests=2, window_seconds=1.0)
+        limiter = RateLimiter(2, 1.0, time_func=clock, sleep_func=clock.sleep)
 
         # First two requests should be immediate
-        start = asyncio.get_event_loop().time()
         await limiter.acquire()
         await limiter.acquire()
-        elapsed = asyncio.get_event_loop().time() - start
 
-        assert elapsed < 0.1  # Should be nearly instant
+        assert clock.sleeps == []
+
+    async def test_rate_limiter_blocks_on_fake_clock(self, clock):
+        """Test that rate limiter blocks for exactly one refill at capacity"""
+        limiter = RateLimiter(1, 0.5, time_func=clock, sleep_func=clock.sleep)
+
+        await limiter.acquire()  # First request
+        await limiter.acquire()  # Second request should wait
 
-    @pytest.mark.asyncio
+        assert clock.t == pytest.approx(0.5)
+
+    @pytest.mark.slow
     async def test_rate_limiter_blocks_when_at_capacity(self):
         """Test that rate limiter blocks when at max capacity"""
         limiter = RateLimiter(max_requests=1, window_seconds=0.5)
 
         await limiter.acquire()  # First request
-        start = asyncio.get_event_loop().time()
+        start = asyncio.get_running_loop().time()
         await limiter.acquire()  # Second request should wait
-        elapsed = asyncio.get_event_loop().time() - start
+        elapsed = asyncio.get_running_loop().time() - start
 
         assert elapsed >= 0.4  # Should wait ~0.5 seconds
 
 
 class TestExponentialBackoff:
-    @pytest.mark.asyncio
-    async def test_backoff_increases_delay(self):
+    async def test_backoff_increases_delay(self, clock):
         """Test that backoff delay increases exponentially"""
-        backoff = ExponentialBackoff(base_delay=0.1, max_delay=1.0, factor=2.0)
+        backoff = ExponentialBackoff(
+            base_delay=0.1, max_delay=1.0, jitter=False, sleep_func=clock.sleep
+        )
 
-        # First wait
-        start = asyncio.get_event_loop().time()
         await backoff.wait()
-        elapsed1 = asyncio.get_event_loop().time() - start
-
-        # Second wait (should be ~0.2s)
-        start = asyncio.get_event_loop().time()
         await backoff.wait()
-        elapsed2 = asyncio.get_event_loop().time() - start
 
-        assert elapsed2 > elapsed1 * 1.5  # Should be significantly longer
+        assert clock.sleeps == pytest.approx([0.1, 0.2])
 
-    @pytest.mark.asyncio
-    async def test_backoff_respects_max_delay(self):
+    async def test_backoff_respects_max_delay(self, clock):
         """Test that backoff respects max delay cap"""
-        backoff = ExponentialBackoff(base_delay=1.0, max_delay=2.0, factor=2.0)
+        backoff = ExponentialBackoff(
+            base_delay=1.0, max_delay=2.0, jitter=False, sleep_func=clock.sleep
+        )
 
         await backoff.wait()  # 1s
         await backoff.wait()  # Should be 2s (capped)
-
-        start = asyncio.get_event_loop().time()
         await backoff.wait()  # Should still be 2s
-        elapsed = asyncio.get_event_loop().time() - start
 
-        assert 1.7 <= elapsed <= 2.3  # Should be ~2s
+        assert clock.sleeps == [1.0, 2.0, 2.0]
 
     def test_backoff_reset(self):
         """Test resetting backoff counter"""
@@ -103,6 +135,7 @@ class TestValidateApiKey:
             validate_api_key("")
 
 
+@pytest.mark.usefixtures("iso_parser")
 class TestParseIsoDatetime:
     def test_parse_iso_with_z(self):
         """Test parsing ISO datetime with Z suffix"""
@@ -111,6 +144,11 @@ class TestParseIsoDatetime:
         assert dt.month == 12
         assert dt.day == 30
 
+    def test_parse_iso_with_lowercase_z(self):
+        """Test a lowercase z suffix is also read as UTC"""
+        dt = parse_iso_datetime("2025-12-30T10:30:00z")
+        assert dt.utcoffset().total_seconds() == 0
+
     def test_parse_iso_with_timezone(self):
         """Test parsing ISO datetime with timezone offset"""
         dt = parse_iso_datetime("2025-12-30T10:30:00+00:00")
@@ -124,88 +162,219 @@ class TestParseIsoDatetime:
 
 
 class TestFormatBytes:
-    def test_format_bytes_bytes(self):
-        """Test formatting bytes"""
-        assert format_bytes(512) == "512.0 B"
-
-    def test_format_bytes_kilobytes(self):
-        """Test formatting kilobytes"""
-        assert "KB" in format_bytes(1024)
-
-    def test_format_bytes_megabytes(self):
-        """Test formatting megabytes"""
-        result = format_bytes(1024 * 1024)
-        assert "MB" in result
-
-    def test_format_bytes_gigabytes(self):
-        """Test formatting gigabytes"""
-        result = format_bytes(1024 * 1024 * 1024)
-        assert "GB" in result
-
-    def test_format_bytes_terabytes(self):
-        """Test formatting terabytes"""
-        result = format_bytes(1024 * 1024 * 1024 * 1024)
-        assert "TB" in result
+    @pytest.mark.parametrize(
+        "n,expected",
+        [
+            (0, "0.0 B"),
+            (0.5, "0.5 B"),
+            (-0.5, "-0.5 B"),
+            (512, "512.0 B"),
+            (1023, "1023.0 B"),
+            (-1, "-1.0 B"),
+            (1024, "1.0 KB"),
+            (1536, "1.5 KB"),
+            (1024**2, "1.0 MB"),
+            (1024**3, "1.0 GB"),
+            (1024**4, "1.0 TB"),
+            (1024**5, "1.0 PB"),
+            (1024**6, "1024.0 PB"),  # Past the largest unit stays in PB
+        ],
+    )
+    def test_format_bytes(self, n, expected):
+        """Test formatting across units, boundaries and signs"""
+        assert format_bytes(n) == expected
 
 
 class TestRateLimiterEdgeCases:
     """Test RateLimiter edge cases"""
 
-    @pytest.mark.asyncio
-    async def test_rate_limiter_concurrent_access(self):
+    async def test_rate_limiter_concurrent_access(self, clock):
         """Test rate limiter handles concurrent requests correctly"""
-        limiter = RateLimiter(max_requests=2, window_seconds=0.5)
+        limiter = RateLimiter(2, 0.5, time_func=clock, sleep_func=clock.sleep)
 
         # Acquire 2 tokens concurrently
         await asyncio.gather(limiter.acquire(), limiter.acquire())
+        assert clock.sleeps == []
 
-        # Third should have to wait
-        start = asyncio.get_event_loop().time()
+        # Third should have to wait for the next token to refill
         await limiter.acquire()
-        elapsed = asyncio.get_event_loop().time() - start
 
-        assert elapsed >= 0.4  # Should wait for window reset
+        assert clock.t == pytest.approx(0.25)  # One token every 0.25 seconds
+
+    @pytest.mark.slow
+    async def test_rate_limiter_parallel_waiters(self):
+        """Test waiters sleep concurrently rather than one after another"""
+        limiter = RateLimiter(max_requests=2, window_seconds=0.4)
+        await limiter.acquire()
+        await limiter.acquire()
+
+        start = asyncio.get_running_loop().time()
+        await asyncio.gather(limiter.acquire(), limiter.acquire())
+        elapsed = asyncio.get_running_loop().time() - start
+
+        # Both tokens refill within a single window, not one window each
+        assert 0.3 <= elapsed < 0.6
+
+    async def test_rate_limiter_weighted_acquire(self, clock):
+        """Test a weighted acquire waits once for all of its tokens"""
+        limiter = RateLimiter(4, 0.4, time_func=clock, sleep_func=clock.sleep)
+        await limiter.acquire(4)
+        await limiter.acquire(3)
+
+        # Three tokens at one every 0.1 seconds, in a single sleep
+        assert clock.sleeps == [pytest.approx(0.3)]
+
+    async def test_rate_limiter_acquire_over_capacity(self):
+        """Test acquiring more than the bucket can hold fails fast"""
+        limiter = RateLimiter(max_requests=2, window_seconds=1.0)
+
+        with pytest.raises(ValueError, match="maximum capacity"):
+            await limiter.acquire(3)
+
+    @pytest.mark.parametrize("amount", [0, -5])
+    async def test_rate_limiter_acquire_non_positive(self, amount):
+        """Test a zero or negative acquire can't add tokens to the bucket"""
+        limiter = RateLimiter(max_requests=2, window_seconds=1.0)
+
+        with pytest.raises(ValueError, match="must be positive"):
+            await limiter.acquire(amount)
+        assert limiter._tokens == 2.0
 
-    @pytest.mark.asyncio
-    async def test_rate_limiter_zero_requests(self):
+    async def test_rate_limiter_zero_requests(self, clock):
         """Test rate limiter with zero max_requests"""
-        limiter = RateLimiter(max_requests=0, window_seconds=1.0)
+        limiter = RateLimiter(0, 1.0, time_func=clock, sleep_func=clock.sleep)
 
-        # Should always have to wait
-        start = asyncio.get_event_loop().time()
+        # Should always have to wait the full window
         await limiter.acquire()
-        elapsed = asyncio.get_event_loop().time() - start
+        await limiter.acquire()
+
+        assert clock.sleeps == [1.0, 1.0]
+
+    async def test_rate_limiter_unlimited(self, clock):
+        """Test rate limiter with max_requests=None never waits"""
+        limiter = RateLimiter(None, 1.0, time_func=clock, sleep_func=clock.sleep)
+
+        for _ in range(100):
+            await limiter.acquire()
+
+        assert clock.sleeps == []
+        assert limiter._tokens == 0.0  # Bucket is never touched
+
+    async def test_rate_limiter_burst_then_refill(self, clock):
+        """Test a full bucket allows a burst, then refills at a steady rate"""
+        limiter = RateLimiter(4, 0.4, time_func=clock, sleep_func=clock.sleep)
+
+        for _ in range(4):
+            await limiter.acquire()
+        assert clock.sleeps == []
+
+        await limiter.acquire()
+        await limiter.acquire()
+
+        # One token every 0.1 seconds
+        assert clock.sleeps == pytest.approx([0.1, 0.1])
+
+    async def test_rate_limiter_acquire_many(self, clock):
+        """Test a batch sleeps once for its whole deficit and leaves a debt"""
+        limiter = RateLimiter(2, 0.5, time_func=clock, sleep_func=clock.sleep)
+
+        await limiter.acquire_many(6)
+
+        # 2 tokens in the bucket, 4 more at 4 per second
+        assert clock.sleeps == [1.0]
+        assert limiter._tokens == -4.0
+
+        # The debt is paid back by the time the batch wakes up
+        await limiter.acquire()
+        assert clock.sleeps == [1.0, 0.25]
+
+    def test_rate_limiter_token_math(self):
+        """Test the synchronous token math against explicit timestamps"""
+        limiter = RateLimiter(max_requests=2, window_seconds=1.0)
+        now = limiter._last_refill
 
-        assert elapsed >= 0.9  # Should wait full window
+        assert limiter._try_acquire(now, 2) == 0.0
+        assert limiter._try_acquire(now, 1) == pytest.approx(0.5)
+        assert limiter._try_acquire(now + 0.5, 1) == 0.0
+
+    def test_rate_limiter_created_outside_loop(self):
+        """Test a limiter built with no running loop works in a later one"""
+        limiter = RateLimiter(max_requests=2, window_seconds=1.0)
+
+        asyncio.run(limiter.acquire())
+        asyncio.run(limiter.acquire())
+
+        assert limiter._tokens < 1
 
 
 class TestExponentialBackoffEdgeCases:
     """Test ExponentialBackoff edge cases"""
 
-    @pytest.mark.asyncio
+    @pytest.mark.slow
     async def test_backoff_max_delay_reached(self):
-        """Test that backoff caps at max_delay"""
-        backoff = ExponentialBackoff(base_delay=1.0, max_delay=2.0, factor=2.0)
+        """Test that backoff caps at max_delay on the real clock"""
+        backoff = ExponentialBackoff(
+            base_delay=1.0, max_delay=2.0, factor=2.0, jitter=False
+        )
 
         # First wait: 1s
-        start = asyncio.get_event_loop().time()
         await backoff.wait()
-        elapsed1 = asyncio.get_event_loop().time() - start
 
         # Second wait: should be 2s (capped)
-        start = asyncio.get_event_loop().time()
+        start = asyncio.get_running_loop().time()
         await backoff.wait()
-        elapsed2 = asyncio.get_event_loop().time() - start
+        elapsed2 = asyncio.get_running_loop().time() - start
 
         # Third wait: should still be 2s
-        start = asyncio.get_event_loop().time()
+        start = asyncio.get_running_loop().time()
         await backoff.wait()
-        elapsed3 = asyncio.get_event_loop().time() - start
+        elapsed3 = asyncio.get_running_loop().time() - start
 
         assert 1.8 <= elapsed2 <= 2.3
         assert 1.8 <= elapsed3 <= 2.3
         assert abs(elapsed2 - elapsed3) < 0.2  # Should be similar
 
+    async def test_backoff_attempt_saturates(self, clock):
+        """Test attempt stops growing once the delay hits max_delay"""
+        backoff = ExponentialBackoff(
+            base_delay=1.0, max_delay=4.0, jitter=False, sleep_func=clock.sleep
+        )
+        for _ in range(10):
+            await backoff.wait()
+
+        assert clock.sleeps == [1.0, 2.0, 4.0, 4.0, 4.0, 4.0, 4.0, 4.0, 4.0, 4.0]
+        assert backoff.attempt == 2
+
+    async def test_backoff_jitter_bounds(self, clock):
+        """Test jitter stays within +/-50% of the delay and varies between calls"""
+        for _ in range(20):
+            backoff = ExponentialBackoff(
+                base_delay=1.0, max_delay=10.0, sleep_func=clock.sleep
+            )
+            await backoff.wait()
+
+        assert all(0.5 <= d <= 1.5 for d in clock.sleeps)
+        assert len(set(clock.sleeps)) > 1
+
+    async def test_backoff_jitter_respects_max_delay(self, clock, monkeypatch):
+        """Test jitter never pushes a capped delay past max_delay"""
+        monkeypatch.setattr(random, "uniform", lambda a, b: b)
+
+        backoff = ExponentialBackoff(
+            base_delay=4.0, max_delay=5.0, sleep_func=clock.sleep
+        )
+        await backoff.wait()
+        await backoff.wait()
+
+        assert clock.sleeps == [5.0, 5.0]
+
+    def test_backoff_has_no_instance_dict(self):
+        """Test ExponentialBackoff uses __slots__ instead of a per-instance dict"""
+        backoff = ExponentialBackoff()
+        assert not hasattr(backoff, "__dict__")
+        with pytest.raises(AttributeError):
+            backoff.delay = 1.0
+
     def test_backoff_reset_multiple_times(self):
         """Test multiple resets work correctly"""
         backoff = ExponentialBackoff()
@@ -246,12 +415,13 @@ class TestValidateApiKeyEdgeCases:
             validate_base_url("http://example.com/path with spaces")
 
 
+@pytest.mark.usefixtures("iso_parser")
 class TestParseIsoDatetimeEdgeCases:
     """Test datetime parsing edge cases"""
 
     def test_parse_iso_datetime_invalid_format(self):
         """Test parsing invalid datetime string"""
-        with pytest.raises(ValueError):
+        with pytest.raises(ValueError, match="Invalid isoformat string: 'not-a-date'"):
             parse_iso_datetime("not-a-date")
 
     def test_parse_iso_datetime_with_microseconds(self):
@@ -259,33 +429,19 @@ class TestParseIsoDatetimeEdgeCases:
         dt = parse_iso_datetime("2025-12-30T10:30:00.123456Z")
         assert dt.microsecond == 123456
 
+    def test_parse_iso_datetime_short_fraction(self):
+        """Test fractional seconds that are not 3 or 6 digits"""
+        dt = parse_iso_datetime("2025-12-30T10:30:00.12Z")
+        assert dt.microsecond == 120000
+        assert dt.utcoffset().total_seconds() == 0
+
+    def test_parse_iso_datetime_naive_short_fraction(self):
+        """Test a space separator with a short fraction and no offset"""
+        dt = parse_iso_datetime("2025-12-30 10:30:00.5")
+        assert dt.microsecond == 500000
+        assert dt.tzinfo is None
+
     def test_parse_iso_datetime_utc_offset(self):
         """Test datetime with UTC offset"""
         dt = parse_iso_datetime("2025-12-30T10:30:00+05:30")
         assert dt.utcoffset() is not None
-
-
-class TestFormatBytesEdgeCases:
-    """Test format_bytes edge cases"""
-
-    def test_format_bytes_zero(self):
-        """Test zero bytes"""
-        assert format_bytes(0) == "0.0 B"
-
-    def test_format_bytes_negative(self):
-        """Test negative bytes (edge case)"""
-        assert format_bytes(-1) == "-1.0 B"
-
-    def test_format_bytes_exact_units(self):
-        """Test exact unit boundaries"""
-        assert "1023.0 B" in format_bytes(1023)  # Actual value
-        assert "1.0 KB" in format_bytes(1024)  # Correct expectation
-        assert "1.0 MB" in format_bytes(1024 * 1024)
-        assert "1.0 GB" in format_bytes(1024 * 1024 * 1024)
-        assert "1.0 TB" in format_bytes(1024 * 1024 * 1024 * 1024)
-
-    def test_format_bytes_decimal_values(self):
-        """Test non-integer byte values"""
-        result = format_bytes(1536)  # 1.5 KB
-        assert "1.5" in result
-        assert "KB" in result